@@ -2,22 +2,39 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from flask import Flask, Response
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from flask import Flask, Response
 
-from .config import Config, DevelopmentConfig, ProductionConfig, TestingConfig
-from .extensions import csrf, db, limiter, login_manager, migrate
+    from .config import Config
 
+# Nothing here builds an app or imports Flask at import time: ``wsgi.py`` and
+# ``manage.py`` own app creation, so ``import app`` stays cheap for test
+# collection, CLI startup and worker boot.
 
-def create_app(config_name: str | None = None) -> Flask:
-    """Create and configure the Flask application."""
-    app = Flask(__name__, instance_relative_config=True)
+
+def create_app(config_name: str | None = None, *, migrations: bool = True) -> Flask:
+    """Create and configure the Flask application.
+
+    ``migrations`` registers Flask-Migrate (and imports Alembic); web workers
+    never run migrations and skip it to boot faster.
+    """
+    from flask import Flask
+
+    from .config import INSTANCE_PATH
+
+    # Pin the instance folder to the one the default SQLite and rate-limit
+    # URIs point at; Flask's own guess differs for installed packages.
+    app = Flask(__name__, instance_path=str(INSTANCE_PATH), instance_relative_config=True)
+    INSTANCE_PATH.mkdir(exist_ok=True)
 
     config_obj = _select_config(config_name)
     app.config.from_object(config_obj)
 
-    _register_extensions(app)
+    _register_extensions(app, migrations=migrations)
     _register_blueprints(app)
+    _register_assets(app)
     _register_cli(app)
     _register_error_handlers(app)
     _register_security_headers(app)
@@ -27,6 +44,8 @@ def create_app(config_name: str | None = None) -> Flask:
 
 
 def _select_config(config_name: str | None) -> type[Config]:
+    from .config import Config, DevelopmentConfig, ProductionConfig, TestingConfig
+
     env = config_name or app_env()
     mapping = {
         "development": DevelopmentConfig,
@@ -42,9 +61,14 @@ def app_env() -> str:
     return getenv("FLASK_ENV", "development")
 
 
-def _register_extensions(app: Flask) -> None:
+def _register_extensions(app: Flask, migrations: bool = True) -> None:
+    from .extensions import csrf, db, fragment_cache, limiter, login_manager
+
     db.init_app(app)
-    migrate.init_app(app, db)
+    if migrations:
+        from flask_migrate import Migrate
+
+        Migrate(app, db)
     csrf.init_app(app)
 
     login_manager.init_app(app)
@@ -52,6 +76,7 @@ def _register_extensions(app: Flask) -> None:
     login_manager.login_message_category = "info"
 
     limiter.init_app(app)
+    fragment_cache.init_app(app)
 
     from .models import User
 
@@ -74,12 +99,22 @@ def _register_blueprints(app: Flask) -> None:
     app.register_blueprint(face_bp, url_prefix="/face")
 
 
+def _register_assets(app: Flask) -> None:
+    from .assets import asset_url, send_static
+
+    # Serve fingerprinted URLs from the regular ``static`` endpoint.
+    app.view_functions["static"] = send_static
+    app.jinja_env.globals["asset_url"] = asset_url
+
+
 def _register_cli(app: Flask) -> None:
     from . import cli
 
     app.cli.add_command(cli.create_admin)
     app.cli.add_command(cli.list_users)
     app.cli.add_command(cli.clear_messages)
+    app.cli.add_command(cli.create_indexes)
+    app.cli.add_command(cli.build_assets)
 
 
 def _register_error_handlers(app: Flask) -> None:
@@ -95,6 +130,8 @@ def _register_error_handlers(app: Flask) -> None:
 
 
 def _register_security_headers(app: Flask) -> None:
+    from flask import Response
+
     @app.after_request
     def set_secure_headers(response: Response) -> Response:
         response.headers.setdefault("X-Frame-Options", "DENY")
@@ -111,6 +148,3 @@ def _register_template_context(app: Flask) -> None:
     @app.context_processor
     def inject_globals():  # pragma: no cover - simple helper
         return {"current_year": datetime.utcnow().year}
-
-
-app = create_app()
@@ -1,23 +1,150 @@
 """Admin routes."""
 from __future__ import annotations
 
-from flask import Blueprint, abort, render_template
+import csv
+import io
+from datetime import datetime
+from typing import Generator, NamedTuple
+
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    render_template,
+    request,
+    stream_with_context,
+)
 from flask_login import current_user, login_required
+from sqlalchemy import func
 
-from ..models import User
+from ..extensions import db
+from ..models import ChatMessage, User
 
 
 bp = Blueprint("admin", __name__, url_prefix="/admin")
 
+_CSV_COLUMNS = ("id", "email", "is_admin", "created_at", "message_count", "last_activity")
+
 
 def _require_admin() -> None:
     if not current_user.is_authenticated or not current_user.is_admin:
         abort(403)
 
 
+def _search_prefix() -> str:
+    return (request.args.get("q") or "").strip().lower()
+
+
+class UserRow(NamedTuple):
+    id: int
+    email: str
+    is_admin: bool
+    created_at: datetime
+    message_count: int
+    last_activity: datetime | None
+
+
+_USER_COLUMNS = (User.id, User.email, User.is_admin, User.created_at)
+
+
+def _users_query(prefix: str = ""):
+    # Ids grow with creation time, so newest-first by the primary key needs
+    # no sort over the unindexed ``created_at``.
+    query = db.session.query(*_USER_COLUMNS).order_by(User.id.desc())
+    if prefix:
+        # Emails are stored lowercase, so a range on ``email`` is the prefix
+        # match; unlike LIKE it can be served by the ``email`` index.
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        query = query.filter(User.email >= prefix, User.email < upper)
+    return query
+
+
+def _message_stats(user_ids=None):
+    """Group messages per user into ``(user_id, message_count, last_activity)``.
+
+    Restricting ``user_ids`` lets the ``(user_id, created_at)`` index serve
+    the aggregate for a page of users without touching other messages.
+    """
+    query = db.session.query(
+        ChatMessage.user_id.label("user_id"),
+        func.count(ChatMessage.id).label("message_count"),
+        func.max(ChatMessage.created_at).label("last_activity"),
+    )
+    if user_ids is not None:
+        query = query.filter(ChatMessage.user_id.in_(user_ids))
+    return query.group_by(ChatMessage.user_id)
+
+
+def _user_stats_query(prefix: str = ""):
+    """Return every matching user row joined with its message aggregates.
+
+    Used for the CSV export, which walks all users anyway; the grouped
+    subquery is outer-joined so no row triggers a lazy ``user.messages``
+    load.
+    """
+    stats = _message_stats().subquery()
+    return (
+        _users_query(prefix)
+        .add_columns(
+            func.coalesce(stats.c.message_count, 0).label("message_count"),
+            stats.c.last_activity,
+        )
+        .outerjoin(stats, stats.c.user_id == User.id)
+    )
+
+
 @bp.route("/users")
 @login_required
 def users():
     _require_admin()
-    users = User.query.order_by(User.created_at.desc()).all()
-    return render_template("admin.html", users=users)
+    prefix = _search_prefix()
+    # Page and count over users only, then aggregate messages for this page.
+    pagination = _users_query(prefix).paginate(
+        per_page=current_app.config["ADMIN_USERS_PER_PAGE"],
+        max_per_page=current_app.config["ADMIN_USERS_PER_PAGE"],
+        error_out=False,
+    )
+    ids = [user.id for user in pagination.items]
+    stats = {row.user_id: row for row in _message_stats(ids)} if ids else {}
+    rows = [
+        UserRow(
+            *user,
+            message_count=stats[user.id].message_count if user.id in stats else 0,
+            last_activity=stats[user.id].last_activity if user.id in stats else None,
+        )
+        for user in pagination.items
+    ]
+    return render_template("admin.html", pagination=pagination, rows=rows, q=prefix)
+
+
+@bp.route("/users.csv")
+@login_required
+def users_csv() -> Response:
+    _require_admin()
+    query = _user_stats_query(_search_prefix()).execution_options(yield_per=500)
+
+    def generate() -> Generator[str, None, None]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(_CSV_COLUMNS)
+        for row in query:
+            writer.writerow(
+                (
+                    row.id,
+                    row.email,
+                    row.is_admin,
+                    row.created_at.isoformat(),
+                    row.message_count,
+                    row.last_activity.isoformat() if row.last_activity else "",
+                )
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+
+    headers = {"Content-Disposition": "attachment; filename=users.csv"}
+    return Response(
+        stream_with_context(generate()), mimetype="text/csv", headers=headers
+    )
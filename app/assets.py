@@ -0,0 +1,140 @@
+"""Fingerprinted, precompressed static assets.
+
+``asset_url("css/app.css")`` renders ``/static/css/app.<hash>.css``. Requests
+for a fingerprinted name are served with an immutable one-year
+``Cache-Control`` and, when the client accepts it, a ``.br`` or ``.gz``
+variant written next to the original by ``flask build-assets``. Plain
+``/static/...`` URLs keep Flask's default revalidating behaviour.
+"""
+from __future__ import annotations
+
+from hashlib import sha256
+from pathlib import Path
+import gzip
+import mimetypes
+import os
+import re
+
+from flask import Response, abort, current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+try:  # optional: ``pip install .[assets]``
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+_FINGERPRINT_LENGTH = 12
+_FINGERPRINTED = re.compile(
+    r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{%d})(?P<suffix>\.[^./]+)$" % _FINGERPRINT_LENGTH
+)
+_COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".txt", ".html"}
+# Preferred first.
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+_ONE_YEAR = 365 * 24 * 60 * 60
+
+# (path, mtime_ns, size) -> digest; a stat per lookup keeps development edits visible.
+_digests: dict[tuple[str, int, int], str] = {}
+_build_versions: dict[str, str] = {}
+
+
+def _digest(path: Path) -> str | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(key)
+    if digest is None:
+        digest = sha256(path.read_bytes()).hexdigest()[:_FINGERPRINT_LENGTH]
+        _digests[key] = digest
+    return digest
+
+
+def asset_url(filename: str) -> str:
+    """Return the fingerprinted URL for a file in the static folder."""
+    digest = _digest(Path(current_app.static_folder) / filename)
+    if digest is None:
+        return url_for("static", filename=filename)
+    stem, suffix = os.path.splitext(filename)
+    return url_for("static", filename=f"{stem}.{digest}{suffix}")
+
+
+def build_version() -> str:
+    """Digest of every static file and template, for use in page ETags.
+
+    Changes whenever a deploy ships new assets or markup, so cached pages
+    never keep pointing at stale asset URLs. Computed once per process
+    unless the app runs in debug mode.
+    """
+    cached = _build_versions.get(current_app.root_path)
+    if cached is not None and not current_app.debug:
+        return cached
+    digest = sha256()
+    for folder in (current_app.static_folder, current_app.template_folder):
+        root = Path(current_app.root_path, folder)
+        for path in sorted(root.rglob("*")):
+            if path.is_file() and path.suffix not in (".gz", ".br"):
+                stat = path.stat()
+                digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    version = _build_versions[current_app.root_path] = digest.hexdigest()[:_FINGERPRINT_LENGTH]
+    return version
+
+
+def send_static(filename: str) -> Response:
+    """Replacement for Flask's ``static`` view that understands fingerprints."""
+    match = _FINGERPRINTED.match(filename)
+    if match is None:
+        return current_app.send_static_file(filename)
+
+    static_folder = Path(current_app.static_folder)
+    original = match["stem"] + match["suffix"]
+    path = safe_join(str(static_folder), original)
+    if path is None or _digest(Path(path)) != match["digest"]:
+        abort(404)
+
+    served, encoding = original, None
+    original_mtime = Path(path).stat().st_mtime_ns
+    for name, extension in _ENCODINGS:
+        variant = static_folder / (original + extension)
+        # ``in`` is true even for ``gzip;q=0``; only a positive quality accepts.
+        if request.accept_encodings.quality(name) > 0 and _is_fresh(variant, original_mtime):
+            served, encoding = original + extension, name
+            break
+
+    response = send_from_directory(
+        static_folder,
+        served,
+        mimetype=mimetypes.guess_type(original)[0] or "application/octet-stream",
+        max_age=_ONE_YEAR,
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.vary.add("Accept-Encoding")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _is_fresh(variant: Path, original_mtime: int) -> bool:
+    try:
+        return variant.stat().st_mtime_ns >= original_mtime
+    except OSError:
+        return False
+
+
+def build_precompressed(static_folder: str | Path) -> list[Path]:
+    """Write ``.gz`` (and ``.br`` when available) next to compressible assets."""
+    written = []
+    for path in sorted(Path(static_folder).rglob("*")):
+        if not path.is_file() or path.suffix not in _COMPRESSIBLE:
+            continue
+        data = path.read_bytes()
+        variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append((".br", brotli.compress(data, quality=11)))
+        for extension, payload in variants:
+            target = path.with_name(path.name + extension)
+            target.write_bytes(payload)
+            written.append(target)
+    return written
@@ -0,0 +1,51 @@
+"""In-process cache for rendered template fragments."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+import threading
+
+
+class FragmentCache:
+    """Thread-safe LRU mapping a key to rendered HTML.
+
+    Bounded by the total length of cached HTML rather than entry count, since
+    a single chat history fragment can be large. Fragments bigger than the
+    whole budget are rendered but not stored. Keys should embed a version
+    (e.g. a user's history version) so stale entries are never read and
+    simply age out.
+    """
+
+    def __init__(self, max_chars: int = 2_000_000) -> None:
+        self.max_chars = max_chars
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.max_chars = app.config["FRAGMENT_CACHE_MAX_CHARS"]
+        self.clear()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        html = render()
+        if len(html) > self.max_chars:
+            return html
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._chars -= len(previous)
+            self._entries[key] = html
+            self._chars += len(html)
+            while self._chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted)
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from typing import Generator
 import json
 
-import requests
-
 
 _TIMEOUT = (5, 120)
 
@@ -23,6 +21,8 @@ class LlmClient:
 
     def generate(self, prompt: str, max_tokens: int = 256) -> str:
         """Return the full completion for ``prompt``."""
+        import requests  # deferred: not needed to boot a worker
+
         payload = {
             "model": self.model,
             "prompt": prompt,
@@ -36,6 +36,8 @@ class LlmClient:
 
     def stream(self, prompt: str, max_tokens: int = 256) -> Generator[str, None, None]:
         """Yield chunks from the streamed response."""
+        import requests
+
         payload = {
             "model": self.model,
             "prompt": prompt,
@@ -1,12 +1,27 @@
 """Chat routes and API endpoints."""
 from __future__ import annotations
 
+from datetime import datetime
+from hashlib import sha256
 from typing import Generator
 
-from flask import Blueprint, Response, current_app, jsonify, render_template, request
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    make_response,
+    render_template,
+    request,
+    session,
+)
 from flask_login import current_user, login_required
+from markupsafe import Markup
+from sqlalchemy import func
+from werkzeug.http import is_resource_modified
 
-from ..extensions import db, limiter
+from ..assets import build_version
+from ..extensions import db, fragment_cache, limiter
 from ..models import ChatMessage
 from .llm_client import LlmClient
 
@@ -40,16 +55,81 @@ def _build_prompt(user_message: str) -> str:
     return "\n".join(lines)
 
 
-@bp.route("/chat")
-@login_required
-def chat():
+def _history_version(user_id: int) -> tuple[int, int, datetime | None]:
+    """Return ``(count, last id, last created_at)`` of a user's messages.
+
+    Count and last id alone are not unique: ``chat_message`` ids are not
+    AUTOINCREMENT, so after a clear SQLite reuses them and "clear, post one"
+    reproduces the previous pair. The newest ``created_at`` still moves
+    forward on every append, so the triple changes on each write. One
+    aggregate over the user index is far cheaper than loading and rendering
+    the history.
+    """
+    count, last_id, last_activity = (
+        db.session.query(
+            func.count(ChatMessage.id),
+            func.max(ChatMessage.id),
+            func.max(ChatMessage.created_at),
+        )
+        .filter(ChatMessage.user_id == user_id)
+        .one()
+    )
+    return count, last_id or 0, last_activity
+
+
+def _chat_etag(version: tuple[int, int, datetime | None]) -> str:
+    # Everything the page renders besides the history: the user's nav, the
+    # session's CSRF token and the deployed templates/assets.
+    parts = (
+        current_user.id,
+        current_user.is_admin,
+        version,
+        session.get("csrf_token", ""),
+        build_version(),
+    )
+    return sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+def _render_messages(user_id: int) -> str:
     messages = (
-        ChatMessage.query.filter_by(user_id=current_user.id)
+        ChatMessage.query.filter_by(user_id=user_id)
         .order_by(ChatMessage.created_at.asc())
         .limit(50)
         .all()
     )
-    return render_template("chat.html", messages=messages)
+    return render_template("partials/chat_messages.html", messages=messages)
+
+
+@bp.route("/chat")
+@login_required
+def chat():
+    user_id = current_user.id
+    version = _history_version(user_id)
+    last_activity = version[2]
+    etag = _chat_etag(version)
+
+    # Only the ETag decides a 304: it also covers nav, CSRF token and asset
+    # hashes, which If-Modified-Since alone cannot see. Flashed messages
+    # have to be rendered (and consumed), so never 304 them.
+    if "_flashes" not in session and not is_resource_modified(request.environ, etag=etag):
+        response = current_app.response_class(status=304)
+    else:
+        messages_html = fragment_cache.get_or_render(
+            ("chat-messages", user_id, version),
+            lambda: _render_messages(user_id),
+        )
+        response = make_response(
+            render_template("chat.html", messages_html=Markup(messages_html))
+        )
+
+    response.set_etag(etag)
+    # Informational only; see above for why it never produces a 304.
+    if last_activity is not None:
+        response.last_modified = last_activity
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add("Cookie")
+    return response
 
 
 @bp.route("/api/chat", methods=["POST"])
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import click
+from flask import current_app
 from flask.cli import with_appcontext
+from sqlalchemy import inspect
 
+from .assets import build_precompressed
 from .extensions import db
 from .models import ChatMessage, User
 
@@ -40,3 +43,32 @@ def clear_messages() -> None:
     deleted = ChatMessage.query.delete()
     db.session.commit()
     click.echo(f"Deleted {deleted} messages")
+
+
+@click.command("create-indexes")
+@with_appcontext
+def create_indexes() -> None:
+    """Create model indexes missing from an existing database.
+
+    ``db.create_all()`` skips tables that already exist, indexes included,
+    so databases created before an index was added need this once.
+    """
+    inspector = inspect(db.engine)
+    created = 0
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(db.engine)
+                created += 1
+    click.echo(f"Created {created} indexes")
+
+
+@click.command("build-assets")
+@with_appcontext
+def build_assets() -> None:
+    """Write precompressed .gz/.br variants of the static assets."""
+    written = build_precompressed(current_app.static_folder)
+    click.echo(f"Wrote {len(written)} precompressed files")
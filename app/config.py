@@ -4,15 +4,13 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from dotenv import load_dotenv
 import os
 
-# Load environment variables from .env if present
-load_dotenv()
-
+# Entry points (``wsgi.py``, ``manage.py`` and the ``flask`` CLI) load ``.env``
+# before this module is imported; the instance folder is created by
+# ``create_app``.
 BASE_DIR = Path(__file__).resolve().parent.parent
 INSTANCE_PATH = BASE_DIR / "instance"
-INSTANCE_PATH.mkdir(exist_ok=True)
 
 
 def _get_env(name: str, default: Any) -> Any:
@@ -31,6 +29,13 @@ class Config:
     REMEMBER_COOKIE_HTTPONLY = True
     WTF_CSRF_TIME_LIMIT = None
     RATE_LIMIT = _get_env("RATE_LIMIT", "30/minute")
+    RATELIMIT_STORAGE_URI = _get_env(
+        "RATELIMIT_STORAGE_URI", f"shm://{INSTANCE_PATH / 'ratelimit.shm'}"
+    )
+    RATELIMIT_STRATEGY = "sliding-window-counter"
+    # Total characters of rendered HTML each worker may cache (~2 MB of ASCII).
+    FRAGMENT_CACHE_MAX_CHARS = int(_get_env("FRAGMENT_CACHE_MAX_CHARS", 2_000_000))
+    ADMIN_USERS_PER_PAGE = int(_get_env("ADMIN_USERS_PER_PAGE", 50))
     OLLAMA_HOST = _get_env("OLLAMA_HOST", "http://localhost:11434")
     OLLAMA_MODEL = _get_env("OLLAMA_MODEL", "llama3")
     SITE_NAME = "Password-less"
@@ -50,3 +55,4 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = "sqlite+pysqlite:///:memory:"
     WTF_CSRF_ENABLED = False
     RATE_LIMIT = "1000/minute"
+    RATELIMIT_STORAGE_URI = "memory://"
@@ -28,6 +28,8 @@ class User(UserMixin, db.Model):
 
 
 class ChatMessage(db.Model):
+    __table_args__ = (db.Index("ix_chat_message_user_created", "user_id", "created_at"),)
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     role = db.Column(db.String(20), nullable=False)
@@ -0,0 +1,269 @@
+"""Rate limiting helpers shared by every worker on a host.
+
+``SharedMemoryStorage`` registers the ``shm://`` scheme with ``limits`` so the
+limiter can be pointed at a memory-mapped file, e.g.
+``RATELIMIT_STORAGE_URI = "shm:///srv/app/instance/ratelimit.shm"``.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from hashlib import blake2b
+from math import floor
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+
+from flask_limiter.util import get_remote_address
+from flask_login import current_user
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+
+_MAGIC = b"PLRLv001"
+_HEADER = struct.Struct("<8sQ")
+# key hash, counter, absolute expiry (epoch seconds)
+_SLOT = struct.Struct("<Qqd")
+_DEFAULT_SLOTS = 65536
+_MAX_PROBE = 64
+
+
+def rate_limit_key() -> str:
+    """Key authenticated requests by user id and anonymous ones by IP."""
+    if current_user.is_authenticated:
+        return f"user:{current_user.get_id()}"
+    return f"ip:{get_remote_address()}"
+
+
+class SharedMemoryStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Fixed-size hash table of counters in an mmap'd file.
+
+    Every gunicorn worker maps the same file, so counters are shared across
+    processes without an external service. Each operation runs under a
+    thread lock plus an exclusive ``flock`` on the file, which makes the
+    read-modify-write of a counter (and the whole sliding window check)
+    atomic across workers. When a probe window is full the entry closest
+    to expiry is evicted, so an overloaded table fails open rather than
+    raising.
+    """
+
+    STORAGE_SCHEME = ["shm"]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options):
+        parsed = urlparse(uri or "")
+        if parsed.netloc:
+            # ``shm://instance/x.shm`` would parse "instance" as a host and
+            # silently open ``/x.shm``; require the absolute three-slash form.
+            raise ValueError(
+                f"shm:// storage takes an absolute path, e.g. shm:///tmp/ratelimit.shm (got {uri!r})"
+            )
+        if not parsed.path:
+            raise ValueError("shm:// storage requires a file path, e.g. shm:///tmp/ratelimit.shm")
+        self.path = Path(parsed.path)
+        self.slots = int(parse_qs(parsed.query).get("slots", [_DEFAULT_SLOTS])[0])
+        self._size = _HEADER.size + self.slots * _SLOT.size
+        self._thread_lock = threading.Lock()
+        self._pid: int | None = None
+        self._fd = -1
+        self._map: mmap.mmap | None = None
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return (OSError, ValueError)
+
+    # -- file handling -------------------------------------------------
+
+    def _open(self) -> None:
+        # flock is tied to the open file description, so a worker forked from
+        # a preloaded master must open its own descriptor.
+        self._close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                mapped = self._map_table(fd)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd, self._map, self._pid = fd, mapped, os.getpid()
+
+    def _map_table(self, fd: int) -> mmap.mmap:
+        # Other workers may have the table mapped, so an initialised file is
+        # never truncated or zeroed; a mismatch is a configuration error.
+        size = os.fstat(fd).st_size
+        if size == 0:
+            os.ftruncate(fd, self._size)
+        elif size != self._size:
+            raise ValueError(
+                f"{self.path} holds a rate limit table of a different size; "
+                f"use another path for slots={self.slots}"
+            )
+        mapped = mmap.mmap(fd, self._size)
+        header = _HEADER.unpack_from(mapped, 0)
+        if header == (bytes(8), 0):
+            # Created but never initialised (e.g. the creator crashed).
+            _HEADER.pack_into(mapped, 0, _MAGIC, self.slots)
+        elif header != (_MAGIC, self.slots):
+            mapped.close()
+            raise ValueError(f"{self.path} is not a rate limit table for slots={self.slots}")
+        return mapped
+
+    def _close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    @contextmanager
+    def _locked(self) -> Iterator[mmap.mmap]:
+        with self._thread_lock:
+            if self._pid != os.getpid():
+                self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield self._map
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    # -- slot table ----------------------------------------------------
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # 0 marks a never-used slot.
+        return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + (index % self.slots) * _SLOT.size
+
+    def _find(self, mapped: mmap.mmap, key: str, now: float, create: bool) -> int | None:
+        """Return the offset of ``key``'s live slot, claiming one if ``create``."""
+        key_hash = self._hash(key)
+        free: int | None = None
+        victim, victim_expiry = None, float("inf")
+        for probe in range(min(_MAX_PROBE, self.slots)):
+            offset = self._offset(key_hash + probe)
+            slot_hash, _, expiry = _SLOT.unpack_from(mapped, offset)
+            if slot_hash == key_hash:
+                if expiry > now:
+                    return offset
+                free = offset if free is None else free
+                break
+            if slot_hash == 0:
+                free = offset if free is None else free
+                break
+            if expiry <= now and free is None:
+                free = offset
+            if expiry < victim_expiry:
+                victim, victim_expiry = offset, expiry
+        if not create:
+            return None
+        offset = free if free is not None else victim
+        _SLOT.pack_into(mapped, offset, key_hash, 0, 0.0)
+        return offset
+
+    def _get(self, mapped: mmap.mmap, key: str, now: float) -> int:
+        offset = self._find(mapped, key, now, create=False)
+        return 0 if offset is None else _SLOT.unpack_from(mapped, offset)[1]
+
+    def _incr(self, mapped: mmap.mmap, key: str, expiry: float, amount: int, now: float) -> int:
+        offset = self._find(mapped, key, now, create=True)
+        key_hash, count, expires_at = _SLOT.unpack_from(mapped, offset)
+        if count == 0:
+            expires_at = now + expiry
+        count += amount
+        _SLOT.pack_into(mapped, offset, key_hash, count, expires_at)
+        return count
+
+    def _clear(self, mapped: mmap.mmap, key: str) -> None:
+        offset = self._find(mapped, key, time.time(), create=False)
+        if offset is not None:
+            # Keep the hash so probe chains through this slot stay intact.
+            _SLOT.pack_into(mapped, offset, _SLOT.unpack_from(mapped, offset)[0], 0, 0.0)
+
+    # -- limits.storage.Storage ----------------------------------------
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        with self._locked() as mapped:
+            return self._incr(mapped, key, expiry, amount, time.time())
+
+    def get(self, key: str) -> int:
+        with self._locked() as mapped:
+            return self._get(mapped, key, time.time())
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._locked() as mapped:
+            offset = self._find(mapped, key, now, create=False)
+            return now if offset is None else _SLOT.unpack_from(mapped, offset)[2]
+
+    def check(self) -> bool:
+        try:
+            with self._locked():
+                return True
+        except OSError:
+            return False
+
+    def reset(self) -> int | None:
+        with self._locked() as mapped:
+            now = time.time()
+            live = sum(
+                1
+                for index in range(self.slots)
+                if _SLOT.unpack_from(mapped, self._offset(index))[2] > now
+            )
+            mapped[_HEADER.size :] = bytes(self._size - _HEADER.size)
+            return live
+
+    def clear(self, key: str) -> None:
+        with self._locked() as mapped:
+            self._clear(mapped, key)
+
+    # -- sliding window counter ----------------------------------------
+
+    def _sliding_window(
+        self, mapped: mmap.mmap, key: str, expiry: int, now: float
+    ) -> tuple[str, int, float, int, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(mapped, previous_key, now)
+        current_count = self._get(mapped, current_key, now)
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return current_key, previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._locked() as mapped:
+            current_key, previous_count, previous_ttl, current_count, _ = self._sliding_window(
+                mapped, key, expiry, now
+            )
+            weighted = previous_count * previous_ttl / expiry + current_count
+            if floor(weighted) + amount > limit:
+                return False
+            # The whole check-and-increment holds the lock, so no revert step is needed.
+            self._incr(mapped, current_key, 2 * expiry, amount, now)
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        with self._locked() as mapped:
+            return self._sliding_window(mapped, key, expiry, time.time())[1:]
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        with self._locked() as mapped:
+            self._clear(mapped, previous_key)
+            self._clear(mapped, current_key)
@@ -0,0 +1,44 @@
+"""Compare per-check overhead of the rate limiter storages.
+
+Run with ``python benchmarks/bench_ratelimit.py``.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+import app.ratelimit  # noqa: F401 - registers the shm:// scheme
+
+
+ITERATIONS = 50_000
+KEYS = 1_000
+
+
+def bench(uri: str, strategy: str) -> float:
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse("1000000/minute")
+    keys = [f"user:{i}" for i in range(KEYS)]
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        limiter.hit(item, keys[i % KEYS])
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        shm = f"shm://{Path(tmp) / 'ratelimit.shm'}"
+        for strategy in ("fixed-window", "sliding-window-counter"):
+            for label, uri in (("memory", "memory://"), ("shm", shm)):
+                print(f"{strategy:<24} {label:<8} {bench(uri, strategy):6.2f} us/check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measure import/startup latency of the entry points against a budget.
+
+Run with ``python benchmarks/bench_startup.py``; exits non-zero when the
+median of any scenario exceeds its budget.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+RUNS = 7
+
+# Median wall-clock budgets in milliseconds, including interpreter start-up.
+BUDGETS_MS = {
+    "import app": 150,
+    "worker boot (wsgi)": 900,
+    "flask --help": 1200,
+}
+
+SCENARIOS = {
+    "import app": [sys.executable, "-c", "import app"],
+    "worker boot (wsgi)": [sys.executable, "-c", "import wsgi"],
+    "flask --help": [sys.executable, "-m", "flask", "--help"],
+}
+
+
+def measure(command: list[str]) -> float:
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, env=env, check=True, capture_output=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    failed = False
+    for name, command in SCENARIOS.items():
+        elapsed = measure(command)
+        budget = BUDGETS_MS[name]
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        failed |= elapsed > budget
+        print(f"{name:<20} {elapsed:7.1f} ms  (budget {budget} ms)  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,11 @@
-"""Helper script for running the Flask app."""
+"""Helper script for running the Flask app and its CLI (``FLASK_APP=manage``)."""
 from __future__ import annotations
 
-from app import create_app
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app  # noqa: E402 - config reads the environment on import
 
 app = create_app()
 
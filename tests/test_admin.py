@@ -0,0 +1,118 @@
+from sqlalchemy import event, inspect, text
+
+from app.admin.routes import _users_query
+
+from app.extensions import db
+from app.models import ChatMessage, User
+
+
+def login(client, email='admin@example.com', password='password123'):
+    return client.post(
+        '/login',
+        data={'email': email, 'password': password},
+        follow_redirects=True,
+    )
+
+
+def add_users(count, prefix='student'):
+    for i in range(count):
+        user = User(email=f'{prefix}{i}@example.com')
+        user.set_password('password123')
+        db.session.add(user)
+    db.session.commit()
+
+
+def test_users_requires_admin(client, user):
+    login(client, email='user@example.com')
+    assert client.get('/admin/users').status_code == 403
+    assert client.get('/admin/users.csv').status_code == 403
+
+
+def test_users_paginated_with_aggregates(client, app, admin_user, user):
+    app.config['ADMIN_USERS_PER_PAGE'] = 2
+    add_users(3)
+    db.session.add_all(
+        ChatMessage(user_id=user.id, role='user', content=f'hi {i}') for i in range(3)
+    )
+    db.session.commit()
+    login(client)
+
+    response = client.get('/admin/users')
+    assert response.status_code == 200
+    assert b'Page 1 of 3' in response.data
+    assert b'5 users' in response.data
+
+    response = client.get('/admin/users?page=2')
+    assert b'user@example.com' in response.data
+    assert b'<td>3</td>' in response.data
+
+
+def test_users_page_aggregates_only_listed_users(client, app, admin_user, user):
+    app.config['ADMIN_USERS_PER_PAGE'] = 1
+    login(client)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        client.get('/admin/users')
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+    grouped = [sql for sql in statements if 'GROUP BY' in sql]
+    assert len(grouped) == 1
+    assert 'IN (' in grouped[0]
+    assert not any('chat_message' in sql for sql in statements if 'count(*)' in sql)
+
+
+def test_users_prefix_search(client, admin_user):
+    add_users(2)
+    add_users(1, prefix='teacher')
+    login(client)
+
+    response = client.get('/admin/users?q=Teach')
+    assert b'teacher0@example.com' in response.data
+    assert b'student0@example.com' not in response.data
+
+    response = client.get('/admin/users?q=%25')
+    assert b'No users found.' in response.data
+
+
+def test_users_csv_export(client, admin_user, user):
+    db.session.add(ChatMessage(user_id=user.id, role='user', content='hello'))
+    db.session.commit()
+    login(client)
+
+    response = client.get('/admin/users.csv')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0] == 'id,email,is_admin,created_at,message_count,last_activity'
+    assert len(lines) == 3
+    row = next(line for line in lines if 'user@example.com' in line)
+    assert row.split(',')[4] == '1'
+
+
+def query_plan(query):
+    sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+    return ' '.join(row[-1] for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')))
+
+
+def test_users_query_plans(app):
+    assert 'USING INDEX ix_user_email' in query_plan(_users_query('stu'))
+    assert 'TEMP B-TREE' not in query_plan(_users_query())
+
+
+def test_create_indexes_adds_missing_index(app):
+    db.session.execute(text('DROP INDEX ix_chat_message_user_created'))
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=['create-indexes'])
+    assert 'Created 1 indexes' in result.output
+    names = {index['name'] for index in inspect(db.engine).get_indexes('chat_message')}
+    assert 'ix_chat_message_user_created' in names
+
+    result = app.test_cli_runner().invoke(args=['create-indexes'])
+    assert 'Created 0 indexes' in result.output
@@ -0,0 +1,55 @@
+import gzip
+import re
+import shutil
+
+from app.assets import build_precompressed
+
+
+def test_pages_link_fingerprinted_assets(client):
+    response = client.get('/login')
+    assert re.search(rb'/static/css/app\.[0-9a-f]{12}\.css', response.data)
+    assert re.search(rb'/static/js/auth\.[0-9a-f]{12}\.js', response.data)
+
+
+def test_fingerprinted_asset_is_immutable(client):
+    url = re.search(rb'/static/css/app\.[0-9a-f]{12}\.css', client.get('/login').data).group().decode()
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == 'text/css'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert 'max-age=31536000' in response.headers['Cache-Control']
+    response.close()
+
+    assert client.get('/static/css/app.000000000000.css').status_code == 404
+    plain = client.get('/static/css/app.css')
+    assert 'immutable' not in plain.headers.get('Cache-Control', '')
+    plain.close()
+
+
+def test_precompressed_variant_is_served(client, app, tmp_path):
+    static = tmp_path / 'static'
+    shutil.copytree(app.static_folder, static)
+    app.static_folder = str(static)
+    written = build_precompressed(static)
+    assert static / 'js' / 'chat.js.gz' in written
+
+    url = re.search(rb'/static/css/app\.[0-9a-f]{12}\.css', client.get('/login').data).group().decode()
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.mimetype == 'text/css'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data) == (static / 'css' / 'app.css').read_bytes()
+    response.close()
+
+
+def test_refused_encodings_are_not_served(client, app, tmp_path):
+    static = tmp_path / 'static'
+    shutil.copytree(app.static_folder, static)
+    app.static_folder = str(static)
+    build_precompressed(static)
+
+    url = re.search(rb'/static/css/app\.[0-9a-f]{12}\.css', client.get('/login').data).group().decode()
+    response = client.get(url, headers={'Accept-Encoding': 'gzip;q=0, br;q=0'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.data == (static / 'css' / 'app.css').read_bytes()
+    response.close()
@@ -0,0 +1,18 @@
+from app.cache import FragmentCache
+
+
+def test_cache_is_bounded_by_total_characters():
+    cache = FragmentCache(max_chars=10)
+    cache.get_or_render('a', lambda: 'x' * 4)
+    cache.get_or_render('b', lambda: 'y' * 4)
+    cache.get_or_render('a', lambda: 'unused')
+    cache.get_or_render('c', lambda: 'z' * 4)
+
+    assert cache.get_or_render('a', lambda: 'miss') == 'xxxx'
+    assert cache.get_or_render('b', lambda: 'miss') == 'miss'
+
+
+def test_oversized_fragment_is_not_cached():
+    cache = FragmentCache(max_chars=3)
+    assert cache.get_or_render('a', lambda: 'long') == 'long'
+    assert cache.get_or_render('a', lambda: 'new') == 'new'
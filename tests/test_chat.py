@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+from app.chat import routes as chat_routes
+
 
 def login(client, email='user@example.com', password='password123'):
     return client.post(
@@ -9,6 +11,13 @@ def login(client, email='user@example.com', password='password123'):
     )
 
 
+def mock_client(mocker, reply):
+    mocker.patch(
+        'app.chat.routes._client',
+        return_value=SimpleNamespace(generate=lambda prompt: reply, stream=lambda prompt: iter([])),
+    )
+
+
 def test_chat_api_returns_response(client, user, mocker):
     login(client)
     mocker.patch(
@@ -40,3 +49,66 @@ def test_chat_stream(client, user, mocker):
     assert response.status_code == 200
     body = b''.join(response.response).decode()
     assert 'mock stream' in body
+
+
+def test_chat_page_conditional_get(client, user, mocker):
+    login(client)
+    response = client.get('/chat')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert 'no-cache' in response.headers['Cache-Control']
+
+    response = client.get('/chat', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    mock_client(mocker, 'mock reply')
+    client.post('/api/chat', json={'message': 'hello'})
+    response = client.get('/chat', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert 'Last-Modified' in response.headers
+    assert b'mock reply' in response.data
+
+
+def test_chat_page_reuses_rendered_messages(client, user, mocker):
+    login(client)
+    mock_client(mocker, 'first reply')
+    client.post('/api/chat', json={'message': 'hello'})
+
+    render = mocker.spy(chat_routes, '_render_messages')
+    client.get('/chat')
+    client.get('/chat')
+    assert render.call_count == 1
+
+    mock_client(mocker, 'second reply')
+    client.post('/api/chat', json={'message': 'again'})
+    response = client.get('/chat')
+    assert render.call_count == 2
+    assert b'second reply' in response.data
+
+
+def test_chat_page_changes_after_clear_and_post(client, user, mocker):
+    login(client)
+    mock_client(mocker, 'OLD reply')
+    client.post('/api/chat', json={'message': 'old'})
+    etag = client.get('/chat').headers['ETag']
+
+    client.post('/api/chat/clear')
+    mock_client(mocker, 'NEW reply')
+    client.post('/api/chat', json={'message': 'new'})
+
+    response = client.get('/chat', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert b'NEW reply' in response.data
+    assert b'OLD reply' not in response.data
+
+
+def test_chat_page_ignores_if_modified_since_alone(client, user, mocker):
+    login(client)
+    mock_client(mocker, 'mock reply')
+    client.post('/api/chat', json={'message': 'hello'})
+    last_modified = client.get('/chat').headers['Last-Modified']
+
+    response = client.get('/chat', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 200
@@ -0,0 +1,85 @@
+import multiprocessing
+
+import pytest
+
+from flask_login import login_user
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+from app.ratelimit import SharedMemoryStorage, rate_limit_key
+
+
+def shm_uri(tmp_path, slots=1024):
+    return f"shm://{tmp_path / 'ratelimit.shm'}?slots={slots}"
+
+
+def test_scheme_is_registered(tmp_path):
+    storage = storage_from_string(shm_uri(tmp_path))
+    assert isinstance(storage, SharedMemoryStorage)
+    assert storage.check()
+
+
+def test_relative_path_is_rejected():
+    with pytest.raises(ValueError):
+        SharedMemoryStorage('shm://instance/ratelimit.shm')
+
+
+def test_counters_and_clear(tmp_path):
+    storage = SharedMemoryStorage(shm_uri(tmp_path))
+    assert storage.incr('k', 60) == 1
+    assert storage.incr('k', 60, amount=2) == 3
+    assert storage.get('k') == 3
+    assert storage.get_expiry('k') > 0
+    storage.clear('k')
+    assert storage.get('k') == 0
+    assert storage.reset() == 0
+
+
+def test_counters_are_shared_between_instances(tmp_path):
+    first = SharedMemoryStorage(shm_uri(tmp_path))
+    second = SharedMemoryStorage(shm_uri(tmp_path))
+    first.incr('k', 60)
+    assert second.incr('k', 60) == 2
+
+
+def test_mismatched_slots_do_not_reset_the_table(tmp_path):
+    first = SharedMemoryStorage(shm_uri(tmp_path, slots=1024))
+    first.incr('k', 60)
+    with pytest.raises(ValueError):
+        SharedMemoryStorage(shm_uri(tmp_path, slots=512)).incr('k', 60)
+    assert first.get('k') == 1
+    assert SharedMemoryStorage(shm_uri(tmp_path, slots=1024)).get('k') == 1
+
+
+def _hit(uri, results):
+    limiter = SlidingWindowCounterRateLimiter(SharedMemoryStorage(uri))
+    item = parse('10/minute')
+    results.put(sum(limiter.hit(item, 'user:1') for _ in range(10)))
+
+
+def test_sliding_window_limit_across_processes(tmp_path):
+    uri = shm_uri(tmp_path)
+    ctx = multiprocessing.get_context('fork')
+    results = ctx.Queue()
+    workers = [ctx.Process(target=_hit, args=(uri, results)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert sum(results.get() for _ in workers) == 10
+
+
+def test_full_table_evicts_instead_of_failing(tmp_path):
+    storage = SharedMemoryStorage(shm_uri(tmp_path, slots=4))
+    for i in range(8):
+        assert storage.incr(f'k{i}', 60) == 1
+    assert storage.get('k7') == 1
+
+
+def test_key_prefers_user_id(app, user):
+    with app.test_request_context(environ_base={'REMOTE_ADDR': '10.0.0.1'}):
+        assert rate_limit_key() == 'ip:10.0.0.1'
+    with app.test_request_context():
+        login_user(user)
+        assert rate_limit_key() == f'user:{user.id}'
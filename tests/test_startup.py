@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def imported_modules(statement):
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True, text=True
+    )
+    return set(result.stdout.split())
+
+
+def test_import_app_does_not_build_an_app():
+    modules = imported_modules('import app')
+    assert 'flask' not in modules
+    assert 'sqlalchemy' not in modules
+    assert 'app.config' not in modules
+
+
+def test_worker_boot_skips_cli_only_dependencies():
+    modules = imported_modules('import wsgi')
+    assert 'app.chat.routes' in modules
+    assert 'alembic' not in modules
+    assert 'requests' not in modules
+
+
+def test_manage_registers_migrations():
+    modules = imported_modules('import manage')
+    assert 'flask_migrate' in modules
+
+
+def test_instance_folder_matches_default_database_path(app):
+    from app.config import INSTANCE_PATH
+
+    assert app.instance_path == str(INSTANCE_PATH)
+    assert INSTANCE_PATH.is_dir()
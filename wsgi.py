@@ -1,6 +1,13 @@
 """WSGI entry point for the application."""
 from __future__ import annotations
 
-from app import app
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app  # noqa: E402 - config reads the environment on import
+
+# Workers never run migrations, so skip Flask-Migrate/Alembic at boot.
+app = create_app(migrations=False)
 
 __all__ = ["app"]